@@ -1,7 +1,11 @@
 from importlib.metadata import version
 
 from gen_art_framework.cli import cli
-from gen_art_framework.distributions import sample_parameter_space
+from gen_art_framework.distributions import (
+    compile_sampler,
+    sample_parameter_space,
+    sample_parameter_space_batch,
+)
 from gen_art_framework.executor import execute_script
 from gen_art_framework.schema import (
     ParameterDefinition,
@@ -22,8 +26,10 @@ __all__ = [
     "ParameterDefinition",
     "ParameterSpace",
     "cli",
+    "compile_sampler",
     "execute_script",
     "parse_parameter_space",
     "sample_parameter_space",
+    "sample_parameter_space_batch",
     "hello",
 ]
@@ -7,7 +7,7 @@ from pathlib import Path
 import click
 import numpy as np
 
-from gen_art_framework.distributions import sample_parameter_space
+from gen_art_framework.distributions import compile_sampler
 from gen_art_framework.executor import execute_script
 from gen_art_framework.schema import parse_parameter_space
 
@@ -77,6 +77,9 @@ def sample(script: Path, count: int, output: Path, seed: int | None):
 
     rng = np.random.default_rng(seed)
 
+    # Build the sampler once rather than re-resolving distributions per image
+    sampler = compile_sampler(param_space)
+
     # Get script name without extension for filenames
     script_name = script.stem
 
@@ -87,7 +90,7 @@ def sample(script: Path, count: int, output: Path, seed: int | None):
         sample_rng = np.random.default_rng(sample_seed)
 
         # Sample parameters
-        params = sample_parameter_space(param_space, sample_rng)
+        params = sampler(sample_rng)
 
         click.echo(f"Generating image {i + 1}/{count}...", err=True)
 
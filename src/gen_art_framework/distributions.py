@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable, Mapping
 from typing import Any
 
 import numpy as np
@@ -29,10 +31,16 @@ class ConstantDistribution:
 
         Returns:
             The constant value, or array of constant values if size is specified.
+            List-valued constants give an array with one row per sample.
         """
         if size is None:
             return self._value
-        return np.full(size, self._value)
+        if np.isscalar(self._value):
+            return np.full(size, self._value)
+        # np.full would try to broadcast a list value across the output
+        samples = np.empty(size, dtype=object)
+        samples.fill(self._value)
+        return _as_sample_array(samples)
 
 
 class ChoiceDistribution:
@@ -58,12 +66,29 @@ class ChoiceDistribution:
 
         Returns:
             A single sampled value, or array of sampled values if size is specified.
+            If the drawn values have different shapes the array has dtype=object.
         """
         if size is None:
             idx = self._rng.choice(len(self._values), p=self._weights)
             return self._values[idx]
         indices = self._rng.choice(len(self._values), size=size, p=self._weights)
-        return np.array([self._values[i] for i in indices])
+        # Gather through an object array so values keep their own types
+        lookup = np.empty(len(self._values), dtype=object)
+        for i, value in enumerate(self._values):
+            lookup[i] = value
+        return _as_sample_array(lookup[indices])
+
+
+def _as_sample_array(samples: np.ndarray) -> np.ndarray:
+    """Convert an object array of sampled values to a regular numpy array.
+
+    The result is what np.array would build from the sampled values. Values that
+    can't be stacked (e.g. lists of different lengths) stay in the object array.
+    """
+    try:
+        return np.array(samples.tolist())
+    except ValueError:
+        return samples
 
 
 class ScipyDistributionWrapper:
@@ -91,6 +116,36 @@ class ScipyDistributionWrapper:
         return self._frozen_dist.rvs(size=size, random_state=self._rng)
 
 
+def compile_sampler(
+    space: ParameterSpace,
+) -> Callable[[np.random.Generator], dict[str, Any]]:
+    """Build a sampling function specialised to a parameter space.
+
+    Distribution lookup and argument validation happen once, here, so the
+    returned function does no per-parameter dispatch. Use this instead of
+    sample_parameter_space when sampling the same space many times.
+
+    Args:
+        space: The parameter space to sample from.
+
+    Returns:
+        A function taking a numpy random generator and returning the same
+        dictionary sample_parameter_space would for that generator.
+
+    Raises:
+        ValueError: If a distribution name is unknown.
+    """
+    samplers = [
+        (param.name, _compile_distribution(param.distribution, param.args, param.mode))
+        for param in space
+    ]
+
+    def sampler(rng: np.random.Generator) -> dict[str, Any]:
+        return {name: sample(rng) for name, sample in samplers}
+
+    return sampler
+
+
 def sample_parameter_space(
     space: ParameterSpace, rng: np.random.Generator
 ) -> dict[str, Any]:
@@ -108,65 +163,133 @@ def sample_parameter_space(
     Raises:
         ValueError: If a distribution name is unknown.
     """
+    return compile_sampler(space)(rng)
+
+
+def sample_parameter_space_batch(
+    space: ParameterSpace, rng: np.random.Generator, n: int
+) -> dict[str, Any]:
+    """Draw many samples from a parameter space at once.
+
+    Each parameter is sampled with a single vectorised call rather than one call
+    per sample, which is much faster when generating large batches.
+
+    Args:
+        space: The parameter space to sample from.
+        rng: A numpy random generator for reproducible sampling.
+        n: Number of samples to draw for each parameter. Must be at least 1.
+
+    Returns:
+        A dictionary mapping parameter names to arrays of ``n`` sampled values.
+        As with sample_parameter_space, parameters with mode="distribution" map to
+        a distribution object with a .rvs() method instead.
+
+    Raises:
+        ValueError: If n is less than 1 or a distribution name is unknown.
+    """
+    # An empty batch has no drawn values to take a dtype or row shape from
+    if n < 1:
+        raise ValueError(f"Batch size 'n' must be at least 1, got {n}.")
+
     result = {}
 
     for param in space:
-        result[param.name] = _sample_distribution(
-            param.distribution, param.args, rng, mode=param.mode
-        )
+        sample = _compile_distribution(param.distribution, param.args, "distribution")
+        dist = sample(rng)
+        if param.mode == "distribution":
+            result[param.name] = dist
+        else:
+            result[param.name] = dist.rvs(size=n)
 
     return result
 
 
-def _sample_distribution(
+def _compile_distribution(
     distribution: str,
-    args: dict[str, Any],
-    rng: np.random.Generator,
+    args: Mapping[str, Any],
     mode: str = "sample",
-) -> Any:
-    """Sample a single value from a distribution or return a frozen distribution object.
+) -> Callable[[np.random.Generator], Any]:
+    """Build a function that samples a single parameter.
 
     Args:
         distribution: The name of the distribution.
         args: Arguments to pass to the distribution.
-        rng: A numpy random generator.
         mode: Either "sample" (returns a sampled value) or "distribution" (returns a distribution object).
 
     Returns:
-        A sampled value (if mode="sample") or a distribution object with .rvs() method (if mode="distribution").
+        A function taking a numpy random generator and returning a sampled value (if
+        mode="sample") or a distribution object with .rvs() method (if mode="distribution").
 
     Raises:
         ValueError: If the distribution name is unknown.
     """
-    # Handle special cases
-    if distribution == "constant":
-        if "value" not in args:
-            raise ValueError("'constant' distribution requires a 'value' argument.")
-        value = args["value"]
-        if mode == "distribution":
-            return ConstantDistribution(value)
-        return value
-
-    if distribution == "choice":
-        if "values" not in args:
-            raise ValueError("'choice' distribution requires a 'values' argument.")
-        values = args["values"]
-        if not values:
-            raise ValueError(
-                "'choice' distribution requires a non-empty 'values' list."
-            )
-        weights = args.get("weights")
-        if weights is not None and len(weights) != len(values):
-            raise ValueError(
-                f"'choice' distribution 'weights' length ({len(weights)}) "
-                f"must match 'values' length ({len(values)})."
-            )
-        if mode == "distribution":
-            return ChoiceDistribution(values, weights, rng)
-        idx = rng.choice(len(values), p=weights)
-        return values[idx]
-
-    # Look up scipy distribution
+    compile_special = _SPECIAL_DISTRIBUTIONS.get(distribution)
+    if compile_special is not None:
+        return compile_special(args, mode)
+
+    dist = _lookup_scipy_distribution(distribution)
+
+    if mode == "distribution":
+        frozen_dist = dist(**args)
+        return lambda rng: ScipyDistributionWrapper(frozen_dist, rng)
+
+    rvs = functools.partial(dist.rvs, **args)
+    return lambda rng: rvs(random_state=rng)
+
+
+def _compile_constant(
+    args: Mapping[str, Any], mode: str
+) -> Callable[[np.random.Generator], Any]:
+    """Build a sampler for the 'constant' distribution."""
+    if "value" not in args:
+        raise ValueError("'constant' distribution requires a 'value' argument.")
+    value = args["value"]
+    if mode == "distribution":
+        constant = ConstantDistribution(value)
+        return lambda rng: constant
+    return lambda rng: value
+
+
+def _compile_choice(
+    args: Mapping[str, Any], mode: str
+) -> Callable[[np.random.Generator], Any]:
+    """Build a sampler for the 'choice' distribution."""
+    if "values" not in args:
+        raise ValueError("'choice' distribution requires a 'values' argument.")
+    values = args["values"]
+    if not values:
+        raise ValueError("'choice' distribution requires a non-empty 'values' list.")
+    weights = args.get("weights")
+    if weights is not None and len(weights) != len(values):
+        raise ValueError(
+            f"'choice' distribution 'weights' length ({len(weights)}) "
+            f"must match 'values' length ({len(values)})."
+        )
+    if mode == "distribution":
+        return lambda rng: ChoiceDistribution(values, weights, rng)
+    n_values = len(values)
+    return lambda rng: values[rng.choice(n_values, p=weights)]
+
+
+# Distributions handled by the framework itself; anything else is looked up
+# in scipy.stats
+_SPECIAL_DISTRIBUTIONS = {
+    "constant": _compile_constant,
+    "choice": _compile_choice,
+}
+
+
+@functools.cache
+def _lookup_scipy_distribution(
+    distribution: str,
+) -> scipy.stats.rv_continuous | scipy.stats.rv_discrete:
+    """Resolve a distribution name to a scipy.stats distribution.
+
+    Lookups are cached since the same few names are resolved on every sample.
+
+    Raises:
+        ValueError: If the name isn't a scipy.stats distribution.
+    """
     dist = getattr(scipy.stats, distribution, None)
     if dist is None or not isinstance(
         dist, (scipy.stats.rv_continuous, scipy.stats.rv_discrete)
@@ -175,9 +298,4 @@ def _sample_distribution(
             f"Unknown distribution '{distribution}'. "
             f"Must be 'constant', 'choice', or a valid scipy.stats distribution."
         )
-
-    if mode == "distribution":
-        frozen_dist = dist(**args)
-        return ScipyDistributionWrapper(frozen_dist, rng)
-
-    return dist.rvs(random_state=rng, **args)
+    return dist
@@ -3,31 +3,91 @@
 from __future__ import annotations
 
 import builtins
+import copy
+import functools
 import keyword
-from dataclasses import dataclass
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Valid values for a parameter's 'mode' field
+_PARAMETER_MODES = frozenset({"sample", "distribution"})
+
+
+class _ReadOnlyDict(dict):
+    """A dict that rejects modification but still pickles and copies like a dict."""
+
+    __slots__ = ("_filled",)
+
+    def __init__(self, *args, **kwargs):
+        # Fill once on construction; calling __init__ again would update in place
+        if getattr(self, "_filled", False):
+            self._read_only()
+        dict.__init__(self, *args, **kwargs)
+        self._filled = True
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None):
+        return cls(dict.fromkeys(iterable, value))
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+# Argument value types that are immutable and can be shared between parses
+_SCALAR_TYPES = (str, int, float, type(None))
+
+# Shared read-only args for parameters that don't define any
+_EMPTY_ARGS: Mapping[str, Any] = _ReadOnlyDict()
+
 # Names that would shadow Python builtins or cause issues when injected as globals
 RESERVED_PARAMETER_NAMES = frozenset(dir(builtins)) | frozenset(keyword.kwlist)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParameterDefinition:
     """Definition of a single parameter with its distribution."""
 
     name: str
     distribution: str
-    args: dict[str, Any]
+    args: Mapping[str, Any]
     mode: str = "sample"
 
+    # args is an unhashable mapping, so don't pretend instances are hashable
+    __hash__ = None
 
-@dataclass
+
+# Not slotted, so the name index can be a plain attribute rather than a field
+# that would show up in fields(), asdict() and astuple()
+@dataclass(frozen=True)
 class ParameterSpace:
-    """Container for multiple parameter definitions."""
+    """Immutable container for multiple parameter definitions."""
+
+    parameters: tuple[ParameterDefinition, ...]
 
-    parameters: list[ParameterDefinition]
+    # Holds ParameterDefinitions, which aren't hashable
+    __hash__ = None
+
+    def __post_init__(self):
+        # Accept any iterable of definitions, but always store a tuple
+        object.__setattr__(self, "parameters", tuple(self.parameters))
+        # If names repeat, lookup returns the first definition with that name
+        by_name = {}
+        for param in self.parameters:
+            by_name.setdefault(param.name, param)
+        object.__setattr__(self, "_by_name", by_name)
 
     def __iter__(self):
         return iter(self.parameters)
@@ -36,10 +96,7 @@ class ParameterSpace:
         return len(self.parameters)
 
     def __getitem__(self, key: str) -> ParameterDefinition:
-        for param in self.parameters:
-            if param.name == key:
-                return param
-        raise KeyError(key)
+        return self._by_name[key]
 
 
 def _extract_yaml_from_docstring(docstring: str) -> str:
@@ -52,9 +109,9 @@ def _extract_yaml_from_docstring(docstring: str) -> str:
 
     content = docstring.strip()
 
-    # First line must start with 'parameters:'
-    first_line = content.split("\n")[0].strip()
-    if not first_line.startswith("parameters:"):
+    # First line must start with 'parameters:' (content is already stripped, so
+    # there's no need to split out the first line)
+    if not content.startswith("parameters:"):
         raise ValueError("Docstring must start with 'parameters:'")
 
     return content
@@ -92,22 +149,30 @@ def _validate_parameter(param_dict: dict[str, Any]) -> ParameterDefinition:
             f"Parameter name '{name}' is reserved (shadows a Python builtin or keyword)"
         )
 
+    # Intern so repeated names share one object and compare by identity when
+    # used as dict keys, script globals, or in distribution dispatch
+    name = sys.intern(name)
+    distribution = sys.intern(distribution)
+
     # Extract and validate mode
     mode = param_dict.get("mode", "sample")
     # Convert to string for validation
     mode_str = str(mode)
-    if mode_str not in ("sample", "distribution"):
+    if mode_str not in _PARAMETER_MODES:
         raise ValueError(
             f"Parameter '{name}' 'mode' must be 'sample' or 'distribution', got '{mode_str}'"
         )
 
     # Extract args (everything except name, distribution, and mode)
-    args = {
-        k: v for k, v in param_dict.items() if k not in ("name", "distribution", "mode")
-    }
+    args = dict(param_dict)
+    del args["name"], args["distribution"]
+    args.pop("mode", None)
 
     return ParameterDefinition(
-        name=name, distribution=distribution, args=args, mode=mode_str
+        name=name,
+        distribution=distribution,
+        args=_ReadOnlyDict(args) if args else _EMPTY_ARGS,
+        mode=mode_str,
     )
 
 
@@ -119,19 +184,59 @@ def parse_parameter_space(docstring: str) -> ParameterSpace:
                    first line.
 
     Returns:
-        A ParameterSpace containing the parsed parameter definitions.
+        A ParameterSpace containing the parsed parameter definitions. Parsing is
+        cached by docstring; the returned space is shallowly immutable, and any
+        mutable argument values (e.g. a choice 'values' list) are fresh copies, so
+        changing them never affects later calls.
 
     Raises:
         ValueError: If the docstring doesn't start with 'parameters:', the YAML is
                     malformed, required fields are missing, or parameter names are
                     duplicated.
     """
+    return _copy_mutable_args(_parse_parameter_space(docstring))
+
+
+def _copy_mutable_args(space: ParameterSpace) -> ParameterSpace:
+    """Return a space whose mutable argument values are copies of those in space.
+
+    Definitions whose args are all immutable scalars are shared rather than copied.
+    """
+    parameters = []
+    copied = False
+    for param in space:
+        if all(isinstance(v, _SCALAR_TYPES) for v in param.args.values()):
+            parameters.append(param)
+            continue
+        args = {k: _copy_value(v) for k, v in param.args.items()}
+        parameters.append(replace(param, args=_ReadOnlyDict(args)))
+        copied = True
+    return ParameterSpace(parameters=parameters) if copied else space
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy a YAML-loaded value, sharing immutable scalars."""
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if type(value) is list:
+        return [_copy_value(item) for item in value]
+    if type(value) is dict:
+        return {k: _copy_value(v) for k, v in value.items()}
+    return copy.deepcopy(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_parameter_space(docstring: str) -> ParameterSpace:
+    """Parse and validate a docstring; see parse_parameter_space.
+
+    Results are cached, so callers must not hand out their mutable argument values.
+    """
     # Extract YAML content
     yaml_content = _extract_yaml_from_docstring(docstring)
 
     # Parse YAML
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Malformed YAML: {e}") from e
 
@@ -147,15 +252,18 @@ def parse_parameter_space(docstring: str) -> ParameterSpace:
     if len(data["parameters"]) == 0:
         raise ValueError("'parameters' must not be empty")
 
-    # Validate and convert each parameter
-    parameters = [_validate_parameter(p) for p in data["parameters"]]
+    # Validate and convert each parameter, collecting duplicate names as we go
+    parameters = []
+    seen = set()
+    duplicates = set()
+    for param_dict in data["parameters"]:
+        param = _validate_parameter(param_dict)
+        if param.name in seen:
+            duplicates.add(param.name)
+        seen.add(param.name)
+        parameters.append(param)
 
-    # Check for duplicate names
-    names = [p.name for p in parameters]
-    duplicates = [name for name in names if names.count(name) > 1]
     if duplicates:
-        raise ValueError(
-            f"Duplicate parameter names: {', '.join(sorted(set(duplicates)))}"
-        )
+        raise ValueError(f"Duplicate parameter names: {', '.join(sorted(duplicates))}")
 
     return ParameterSpace(parameters=parameters)
@@ -5,7 +5,13 @@ from textwrap import dedent
 import numpy as np
 import pytest
 
-from gen_art_framework import parse_parameter_space, sample_parameter_space
+from gen_art_framework import (
+    compile_sampler,
+    parse_parameter_space,
+    sample_parameter_space,
+    sample_parameter_space_batch,
+)
+from gen_art_framework.distributions import ChoiceDistribution
 
 
 class TestDeterministicSampling:
@@ -593,3 +599,205 @@ class TestDistributionMode:
 
         assert len(samples) == 5
         assert all(s in ["red", "green"] for s in samples)
+
+    @pytest.mark.parametrize(
+        "values",
+        [[1, "a", 2.5], [True, 2], [None, 1], [[1, 2], [3, 4]], [True, False]],
+    )
+    def test_choice_distribution_with_size_keeps_drawn_values(self, values):
+        """Sized draws are an array of exactly the drawn values."""
+        dist = ChoiceDistribution(values, None, np.random.default_rng(42))
+
+        samples = dist.rvs(size=10)
+
+        indices = np.random.default_rng(42).choice(len(values), size=10)
+        expected = np.array([values[i] for i in indices])
+        assert samples.dtype == expected.dtype
+        np.testing.assert_array_equal(samples, expected)
+
+
+class TestBatchSampling:
+    """Tests for drawing many samples at once."""
+
+    @pytest.mark.parametrize("n", [0, -1])
+    def test_batch_rejects_empty_batch(self, n):
+        """Raises ValueError when n is less than 1."""
+        docstring = dedent("""
+            parameters:
+              - name: colour
+                distribution: choice
+                values: [1, 2]
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(42)
+
+        with pytest.raises(ValueError, match="must be at least 1"):
+            sample_parameter_space_batch(space, rng, n)
+
+    def test_batch_returns_arrays_of_requested_size(self):
+        """Each sample-mode parameter gets an array of n values."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: uniform
+                loc: 0
+                scale: 1
+              - name: label
+                distribution: constant
+                value: "test"
+              - name: colour
+                distribution: choice
+                values: ["red", "blue"]
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(42)
+
+        result = sample_parameter_space_batch(space, rng, 100)
+
+        assert result["x"].shape == (100,)
+        assert np.all((result["x"] >= 0) & (result["x"] <= 1))
+        assert np.all(result["label"] == "test")
+        assert set(result["colour"]) <= {"red", "blue"}
+
+    def test_batch_list_valued_constant(self):
+        """List-valued constants give one row per sample."""
+        docstring = dedent("""
+            parameters:
+              - name: size
+                distribution: constant
+                value: [800, 600]
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(42)
+
+        result = sample_parameter_space_batch(space, rng, 5)
+
+        assert result["size"].shape == (5, 2)
+        assert all(list(row) == [800, 600] for row in result["size"])
+
+    def test_batch_list_valued_choice(self):
+        """Choices between equal-length lists give one row per sample."""
+        docstring = dedent("""
+            parameters:
+              - name: palette
+                distribution: choice
+                values: [["red", "blue"], ["black", "white"]]
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(42)
+
+        result = sample_parameter_space_batch(space, rng, 5)
+
+        assert result["palette"].shape == (5, 2)
+        assert all(
+            list(row) in (["red", "blue"], ["black", "white"])
+            for row in result["palette"]
+        )
+
+    def test_batch_ragged_choice(self):
+        """Choices between lists of different lengths give an object array."""
+        docstring = dedent("""
+            parameters:
+              - name: palette
+                distribution: choice
+                values: [["red"], ["black", "white", "grey"]]
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(0)
+
+        result = sample_parameter_space_batch(space, rng, 20)
+
+        assert result["palette"].shape == (20,)
+        assert all(
+            value in (["red"], ["black", "white", "grey"])
+            for value in result["palette"]
+        )
+
+    def test_batch_deterministic_with_seed(self):
+        """Same seed produces identical batches."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: norm
+                loc: 0
+                scale: 1
+        """)
+        space = parse_parameter_space(docstring)
+
+        result1 = sample_parameter_space_batch(space, np.random.default_rng(7), 10)
+        result2 = sample_parameter_space_batch(space, np.random.default_rng(7), 10)
+
+        np.testing.assert_array_equal(result1["x"], result2["x"])
+
+    def test_batch_distribution_mode_returns_object(self):
+        """Distribution-mode parameters are returned as distribution objects."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: uniform
+                loc: 0
+                scale: 1
+                mode: distribution
+        """)
+        space = parse_parameter_space(docstring)
+        rng = np.random.default_rng(42)
+
+        result = sample_parameter_space_batch(space, rng, 10)
+
+        assert hasattr(result["x"], "rvs")
+
+
+class TestCompiledSampler:
+    """Tests for samplers compiled from a parameter space."""
+
+    def test_matches_sample_parameter_space(self):
+        """Compiled sampler produces the same values for the same seed."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: uniform
+                loc: 0
+                scale: 1
+              - name: colour
+                distribution: choice
+                values: ["red", "green", "blue"]
+                weights: [0.2, 0.3, 0.5]
+              - name: seed
+                distribution: constant
+                value: 42
+        """)
+        space = parse_parameter_space(docstring)
+        sampler = compile_sampler(space)
+
+        for seed in range(5):
+            expected = sample_parameter_space(space, np.random.default_rng(seed))
+            assert sampler(np.random.default_rng(seed)) == expected
+
+    def test_distribution_mode_uses_given_rng(self):
+        """Distribution objects are bound to the generator passed to each call."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: norm
+                loc: 0
+                scale: 1
+                mode: distribution
+        """)
+        sampler = compile_sampler(parse_parameter_space(docstring))
+
+        samples1 = sampler(np.random.default_rng(3))["x"].rvs(size=4)
+        samples2 = sampler(np.random.default_rng(3))["x"].rvs(size=4)
+
+        np.testing.assert_array_equal(samples1, samples2)
+
+    def test_unknown_distribution_raises_on_compile(self):
+        """Unknown distributions are reported when the sampler is built."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: not_a_distribution
+        """)
+        space = parse_parameter_space(docstring)
+
+        with pytest.raises(ValueError, match="Unknown distribution"):
+            compile_sampler(space)
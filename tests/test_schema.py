@@ -1,10 +1,18 @@
 """Tests for parameter space schema parsing."""
 
+import copy
+import json
+import pickle
+from dataclasses import asdict, astuple, fields
 from textwrap import dedent
 
 import pytest
 
-from gen_art_framework import parse_parameter_space
+from gen_art_framework import (
+    ParameterDefinition,
+    ParameterSpace,
+    parse_parameter_space,
+)
 
 
 class TestDocstringFormat:
@@ -217,6 +225,19 @@ class TestValidationErrors:
         with pytest.raises(ValueError, match="Duplicate parameter names: x"):
             parse_parameter_space(docstring)
 
+    def test_aliased_duplicate_raises(self):
+        """Reports a duplicate when a YAML alias repeats a parameter entry."""
+        docstring = dedent("""
+            parameters:
+              - &p
+                name: x
+                distribution: constant
+                value: 1
+              - *p
+        """)
+        with pytest.raises(ValueError, match="Duplicate parameter names: x"):
+            parse_parameter_space(docstring)
+
     def test_name_not_string_raises(self):
         """Raises ValueError when name is not a string."""
         docstring = dedent("""
@@ -426,6 +447,21 @@ class TestParameterSpace:
         with pytest.raises(KeyError):
             result["does_not_exist"]
 
+    def test_getitem_returns_first_of_repeated_names(self):
+        """Lookup returns the first definition when a name is repeated."""
+        first = ParameterDefinition(name="x", distribution="constant", args={})
+        second = ParameterDefinition(name="x", distribution="uniform", args={})
+        space = ParameterSpace(parameters=[first, second])
+        assert space["x"] is first
+
+    def test_name_index_is_not_a_field(self):
+        """The name index is left out of fields(), asdict() and astuple()."""
+        param = ParameterDefinition(name="x", distribution="constant", args={})
+        space = ParameterSpace(parameters=[param])
+        assert [f.name for f in fields(space)] == ["parameters"]
+        assert asdict(space) == {"parameters": (asdict(param),)}
+        assert astuple(space) == ((astuple(param),),)
+
 
 class TestMultipleParameters:
     """Tests for parameter spaces with multiple parameters."""
@@ -455,3 +491,151 @@ class TestMultipleParameters:
         assert result["y"].distribution == "normal"
         assert result["colour"].distribution == "choice"
         assert result["seed"].distribution == "constant"
+
+
+class TestCaching:
+    """Tests for caching of parsed docstrings."""
+
+    def test_repeated_parse_returns_equal_space(self):
+        """Parsing the same docstring twice gives equal results."""
+        docstring = dedent("""
+            parameters:
+              - name: colour
+                distribution: choice
+                values: ["red", "blue"]
+        """)
+        assert parse_parameter_space(docstring) == parse_parameter_space(docstring)
+
+    def test_scalar_only_space_is_reused(self):
+        """Spaces with only scalar args are returned straight from the cache."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: uniform
+                loc: 0
+                scale: 1
+        """)
+        assert parse_parameter_space(docstring) is parse_parameter_space(docstring)
+
+    def test_parsed_space_is_immutable(self):
+        """Cached results cannot be modified by callers."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: constant
+                value: 1
+        """)
+        result = parse_parameter_space(docstring)
+        with pytest.raises(AttributeError):
+            result["x"].name = "y"
+        with pytest.raises(TypeError):
+            result["x"].args["value"] = 2
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda args: args.__setitem__("x", 1),
+            lambda args: args.__delitem__("x"),
+            lambda args: args.__ior__({"x": 1}),
+            lambda args: args.__init__(x=1),
+            lambda args: args.update(x=1),
+            lambda args: args.setdefault("x", 1),
+            lambda args: args.pop("x", None),
+            lambda args: args.popitem(),
+            lambda args: args.clear(),
+        ],
+    )
+    def test_shared_empty_args_cannot_be_modified(self, mutate):
+        """The empty args shared by parameters without arguments stay empty."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: norm
+        """)
+        args = parse_parameter_space(docstring)["x"].args
+        with pytest.raises(TypeError, match="read-only"):
+            mutate(args)
+        other = dedent("""
+            parameters:
+              - name: y
+                distribution: uniform
+        """)
+        assert parse_parameter_space(other)["y"].args == {}
+
+    def test_nested_values_not_shared_between_parses(self):
+        """Mutating a nested value doesn't affect later parses of the docstring."""
+        docstring = dedent("""
+            parameters:
+              - name: palette
+                distribution: constant
+                value: ["red", "blue"]
+              - name: colour
+                distribution: choice
+                values: [["red"], ["blue"]]
+        """)
+        first = parse_parameter_space(docstring)
+        first["palette"].args["value"].append("green")
+        first["colour"].args["values"][0].append("green")
+
+        second = parse_parameter_space(docstring)
+        assert second["palette"].args["value"] == ["red", "blue"]
+        assert second["colour"].args["values"] == [["red"], ["blue"]]
+
+    def test_pickle_round_trip(self):
+        """Parsed spaces can be pickled, e.g. to send to worker processes."""
+        docstring = dedent("""
+            parameters:
+              - name: colour
+                distribution: choice
+                values: ["red", "blue"]
+              - name: seed
+                distribution: constant
+                value: 42
+        """)
+        result = parse_parameter_space(docstring)
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored == result
+        assert restored["colour"].args["values"] == ["red", "blue"]
+        with pytest.raises(TypeError):
+            restored["seed"].args["value"] = 1
+
+    def test_deepcopy_round_trip(self):
+        """Parsed spaces can be deep-copied."""
+        docstring = dedent("""
+            parameters:
+              - name: colour
+                distribution: choice
+                values: ["red", "blue"]
+        """)
+        result = parse_parameter_space(docstring)
+        copied = copy.deepcopy(result)
+        assert copied == result
+        assert copied["colour"].args["values"] is not result["colour"].args["values"]
+
+    def test_args_convert_like_a_dict(self):
+        """Args work with asdict and json like a plain dict."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: uniform
+                loc: 0
+                scale: 1
+        """)
+        param = parse_parameter_space(docstring)["x"]
+        assert asdict(param)["args"] == {"loc": 0, "scale": 1}
+        assert json.loads(json.dumps(param.args)) == {"loc": 0, "scale": 1}
+        assert type(param.args).fromkeys(["loc"], 0) == {"loc": 0}
+
+    def test_not_hashable(self):
+        """Parsed spaces and definitions are explicitly unhashable."""
+        docstring = dedent("""
+            parameters:
+              - name: x
+                distribution: constant
+                value: 1
+        """)
+        result = parse_parameter_space(docstring)
+        with pytest.raises(TypeError, match="unhashable type: 'ParameterSpace'"):
+            hash(result)
+        with pytest.raises(TypeError, match="unhashable type: 'ParameterDefinition'"):
+            hash(result["x"])